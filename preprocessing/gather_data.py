@@ -1,22 +1,209 @@
 import os
+import functools
+import hashlib
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httplib2
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from datetime import datetime, timedelta
-import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from dotenv import load_dotenv
-from typing import List
-import isodate 
+from typing import List, Optional
+import re
+
+# YouTube durations are ISO 8601 of the form P#DT#H#M#S (days only on very long videos)
+_DURATION_RE = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+# Socket timeout in seconds for YouTube API connections
+HTTP_TIMEOUT = 30
+
+# Default number of channels fetched concurrently by fetch_many
+MAX_WORKERS = 16
+
+# Retry policy for transient API errors
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+RETRYABLE_STATUSES = (403, 429, 500, 503)
+# 403 reasons that clear up after backing off; anything else (e.g. quotaExceeded) is final
+RETRYABLE_403_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+# Partial-response field masks so the API only returns what is parsed below
+_FIELDS_SEARCH = 'nextPageToken,items(id/videoId,snippet(title,description,publishedAt,thumbnails/high/url))'
+_FIELDS_VIDEOS = ('items(id,snippet(categoryId,tags,defaultLanguage,defaultAudioLanguage),'
+                  'statistics(viewCount,likeCount,commentCount),contentDetails/duration)')
+_FIELDS_CHANNELS = 'items(id,snippet/title,statistics(subscriberCount,videoCount,viewCount))'
+_FIELDS_CHANNEL_SEARCH = 'nextPageToken,items/snippet(channelId,title,description)'
+
+# Video statistics stored as integer columns, in (views, likes, comments_count) order
+_STAT_KEYS = ('viewCount', 'likeCount', 'commentCount')
+
+# How long cached API responses stay valid on disk
+CACHE_TTL = timedelta(hours=24)
+
+# Column layout of the video tables built by fetch_channel_videos
+VIDEO_SCHEMA = pa.schema([
+    ('video_id', pa.string()),
+    ('title', pa.string()),
+    ('description', pa.string()),
+    ('published_at', pa.string()),
+    ('thumbnail_url', pa.string()),
+    ('views', pa.int64()),
+    ('likes', pa.int64()),
+    ('comments_count', pa.int64()),
+    ('current_subscriber_count', pa.int64()),
+    ('duration_seconds', pa.int32()),
+    ('comments_enabled', pa.bool_()),
+    ('category_id', pa.string()),
+    ('category_name', pa.dictionary(pa.int16(), pa.string())),
+    ('tags', pa.list_(pa.string())),
+    ('default_language', pa.dictionary(pa.int16(), pa.string())),
+    ('default_audio_language', pa.dictionary(pa.int16(), pa.string()))
+])
+
+_thread_state = threading.local()
+
+def _thread_http():
+    """
+    Get the persistent HTTP connection for the current thread.
+    
+    httplib2.Http is not thread-safe, so each thread keeps its own kept-alive
+    connection instead of sharing one.
+    
+    Returns:
+        httplib2.Http: Connection owned by the calling thread
+    """
+    if not hasattr(_thread_state, 'http'):
+        _thread_state.http = httplib2.Http(timeout=HTTP_TIMEOUT)
+    return _thread_state.http
+
+def _build_youtube(api_key):
+    """
+    Build a YouTube Data API v3 client without fetching the discovery document.
+    
+    static_discovery loads the discovery document bundled with
+    google-api-python-client instead of downloading and parsing it per client.
+    
+    Args:
+        api_key: YouTube Data API key for authentication
+        
+    Returns:
+        googleapiclient.discovery.Resource: YouTube API client
+    """
+    return build('youtube', 'v3', developerKey=api_key, http=_thread_http(),
+                 static_discovery=True, cache_discovery=False)
+
+def _execute(request):
+    """
+    Execute an API request, retrying rate limits and server errors with backoff.
+    
+    Retries honor a Retry-After header when present and otherwise sleep
+    min(2**attempt, MAX_BACKOFF_SECONDS) seconds plus jitter. Exhausted daily
+    quota and other client errors are raised immediately.
+    
+    Args:
+        request: googleapiclient HttpRequest to execute
+        
+    Returns:
+        dict: Parsed API response
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return request.execute(http=_thread_http())
+        except HttpError as e:
+            status = e.resp.status
+            if status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                raise
+            if status == 403:
+                reasons = {detail.get('reason') for detail in (getattr(e, 'error_details', None) or [])
+                           if isinstance(detail, dict)}
+                if not reasons & set(RETRYABLE_403_REASONS):
+                    raise
+            retry_after = e.resp.get('retry-after')
+            if retry_after and retry_after.isdigit():
+                delay = int(retry_after)
+            else:
+                delay = min(2 ** attempt, MAX_BACKOFF_SECONDS) + random.random()
+            print(f"API request failed with HTTP {status}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+def _stats_to_ints(statistics):
+    """
+    Convert a video's string statistics to integers, treating missing ones as 0.
+    
+    Args:
+        statistics: 'statistics' part of a videos resource
+        
+    Returns:
+        tuple: (views, likes, comments_count) as ints
+    """
+    return tuple(int(statistics.get(key, 0)) for key in _STAT_KEYS)
+
+def _as_table(data):
+    """
+    Get an Arrow table for data that may also be a pandas DataFrame.
+    
+    Args:
+        data: pyarrow.Table or pandas.DataFrame
+        
+    Returns:
+        pyarrow.Table: data itself, or the DataFrame converted without its index
+    """
+    if isinstance(data, pa.Table):
+        return data
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+def _csv_compatible(table):
+    """
+    Convert Arrow columns the CSV writer cannot emit into plain strings.
+    
+    Dictionary columns are decoded to their values and list columns (tags) are
+    written in the same "['a', 'b']" form pandas.to_csv produced.
+    
+    Args:
+        table: pyarrow.Table to convert
+        
+    Returns:
+        pyarrow.Table: Table containing only CSV-writable column types
+    """
+    columns = []
+    for field, column in zip(table.schema, table.columns):
+        if pa.types.is_dictionary(field.type):
+            column = column.cast(field.type.value_type)
+        elif pa.types.is_list(field.type):
+            column = pa.array(
+                [str(value) if value is not None else None for value in column.to_pylist()],
+                type=pa.string()
+            )
+        columns.append(column)
+    return pa.table(columns, names=table.column_names)
 
 class YouTubeDataFetcher:
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache_dir='.yt_cache', cache_ttl=CACHE_TTL):
         """
         Initialize the YouTube Data Fetcher.
         
         Args:
             api_key: YouTube Data API key for authentication
+            cache_dir: Directory for cached API responses, None to disable (default: '.yt_cache')
+            cache_ttl: How long cached responses are reused (default: 24 hours)
         """
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+        # Persistent connection reused (kept alive) across API calls; requests
+        # executed from other threads use that thread's own connection
+        self.http = _thread_http()
+        self.youtube = _build_youtube(api_key)
         self.api_key = api_key
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self._response_cache = {}
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
         # YouTube category IDs (most common ones)
         self.category_ids = {
             'film_animation': 1,
@@ -34,6 +221,8 @@ class YouTubeDataFetcher:
             'science_tech': 28,
             'nonprofits': 29
         }
+        # Reverse mapping of category IDs (as returned by the API) to names
+        self._category_names = {str(v): k for k, v in self.category_ids.items()}
 
     def get_channel_id(self, channel_name):
         """
@@ -50,11 +239,12 @@ class YouTubeDataFetcher:
                 part='id,snippet',
                 q=channel_name,
                 type='channel',
-                maxResults=1
+                maxResults=1,
+                fields='items/id/channelId'
             )
-            response = request.execute()
+            response = _execute(request)
             
-            if response['items']:
+            if response.get('items'):
                 return response['items'][0]['id']['channelId']
             return None
         except Exception as e:
@@ -74,10 +264,11 @@ class YouTubeDataFetcher:
         try:
             request = self.youtube.videos().list(
                 part='snippet',
-                id=video_id
+                id=video_id,
+                fields='items/snippet/categoryId'
             )
-            response = request.execute()
-            if response['items']:
+            response = self._cached_execute(request)
+            if response.get('items'):
                 return response['items'][0]['snippet']['categoryId']
             return None
         except Exception as e:
@@ -89,7 +280,9 @@ class YouTubeDataFetcher:
                            start_date=None, 
                            end_date=None, 
                            max_videos=50,
-                           category=None):
+                           category=None,
+                           sink: Optional[pq.ParquetWriter] = None,
+                           as_pandas: bool = False):
         """
         Fetch videos from a specific channel with optional filters.
         
@@ -99,9 +292,13 @@ class YouTubeDataFetcher:
             end_date: End date for video search (default: current date)
             max_videos: Maximum number of videos to fetch (default: 50)
             category: Filter videos by category name (default: None)
+            sink: ParquetWriter using VIDEO_SCHEMA; if given, each page is written
+                to it as soon as it is fetched instead of being kept in memory (default: None)
+            as_pandas: Return a pandas DataFrame instead of an Arrow table (default: False)
             
         Returns:
-            pandas.DataFrame: DataFrame containing video details
+            pyarrow.Table: Video details with VIDEO_SCHEMA (empty when sink is given),
+                or a pandas.DataFrame when as_pandas is True
         """
         # Set default date range if not provided
         if not start_date:
@@ -113,7 +310,9 @@ class YouTubeDataFetcher:
         published_after = start_date.isoformat() + 'Z'
         published_before = end_date.isoformat() + 'Z'
 
-        video_details = []
+        remaining = max_videos
+        page, page_count = None, 0
+        tables = []
         next_page_token = None
 
         # Get category ID if category is specified
@@ -121,99 +320,205 @@ class YouTubeDataFetcher:
         
         # Get channel details including subscriber count
         try:
-            channel_response = self.youtube.channels().list(
+            channel_response = self._cached_execute(self.youtube.channels().list(
                 part='statistics',
-                id=channel_id
-            ).execute()
+                id=channel_id,
+                fields=_FIELDS_CHANNELS
+            ))
             subscriber_count = int(channel_response['items'][0]['statistics']['subscriberCount'])
         except Exception as e:
             print(f"Error fetching channel statistics: {e}")
             subscriber_count = 0
 
-        # Reverse mapping of category IDs to names
-        category_names = {str(v): k for k, v in self.category_ids.items()}
-
         try:
-            while len(video_details) < max_videos:
+            while remaining > 0:
+                page_size = min(50, remaining)
                 # Search for videos in the channel
                 request = self.youtube.search().list(
                     part='id,snippet',
                     channelId=channel_id,
                     type='video',
                     order='date',
-                    maxResults=min(50, max_videos - len(video_details)),
+                    maxResults=page_size,
                     publishedAfter=published_after,
                     publishedBefore=published_before,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields=_FIELDS_SEARCH
                 )
-                response = request.execute()
+                response = _execute(request)
 
-                # Fetch detailed video statistics
+                # Fetch detailed video statistics for the whole page in one call
+                page_video_ids = [item['id']['videoId'] for item in response.get('items', [])]
+                videos_by_id = {}
+                if page_video_ids:
+                    stats_response = _execute(self.youtube.videos().list(
+                        part='statistics,snippet,contentDetails',
+                        id=','.join(page_video_ids),
+                        maxResults=50,
+                        fields=_FIELDS_VIDEOS
+                    ))
+                    videos_by_id = {video['id']: video for video in stats_response.get('items', [])}
+
+                page, page_count = self._new_page_buffers(page_size), 0
                 for item in response.get('items', []):
                     video_id = item['id']['videoId']
+                    video_info = videos_by_id.get(video_id)
                     
-                    # Get video statistics and category
-                    stats_request = self.youtube.videos().list(
-                        part='statistics,snippet,contentDetails',  # Added contentDetails
-                        id=video_id
-                    )
-                    stats_response = stats_request.execute()
-                    
-                    if stats_response['items']:
-                        video_info = stats_response['items'][0]
+                    if video_info:
                         video_category_id = video_info['snippet']['categoryId']
                         
                         # Skip if category doesn't match (when category filter is active)
                         if target_category_id and video_category_id != target_category_id:
                             continue
                         
-                        # Get duration in seconds
-                        duration_str = video_info['contentDetails']['duration']  # Format: PT#M#S
-                        duration_seconds = self._parse_duration(duration_str)
-                        
-                        # Get comment details if available
-                        try:
-                            comments_response = self.youtube.commentThreads().list(
-                                part='snippet',
-                                videoId=video_id,
-                                maxResults=1
-                            ).execute()
-                            has_comments_enabled = True
-                        except:
-                            has_comments_enabled = False
-                        
-                        video_details.append({
-                            'video_id': video_id,
-                            'title': item['snippet']['title'],
-                            'description': item['snippet']['description'],
-                            'published_at': item['snippet']['publishedAt'],
-                            'thumbnail_url': item['snippet']['thumbnails']['high']['url'],
-                            'views': int(video_info['statistics'].get('viewCount', 0)),
-                            'likes': int(video_info['statistics'].get('likeCount', 0)),
-                            'comments_count': int(video_info['statistics'].get('commentCount', 0)),
-                            'current_subscriber_count': subscriber_count,
-                            'duration_seconds': duration_seconds,
-                            'comments_enabled': has_comments_enabled,
-                            'category_id': video_category_id,
-                            'category_name': category_names.get(video_category_id, 'Unknown'),
-                            'tags': video_info['snippet'].get('tags', []),
-                            'default_language': video_info['snippet'].get('defaultLanguage', 'Unknown'),
-                            'default_audio_language': video_info['snippet'].get('defaultAudioLanguage', 'Unknown')
-                        })
-
-                        if len(video_details) >= max_videos:
+                        statistics = video_info['statistics']
+                        page['video_id'].append(video_id)
+                        page['title'].append(item['snippet']['title'])
+                        page['description'].append(item['snippet']['description'])
+                        page['published_at'].append(item['snippet']['publishedAt'])
+                        page['thumbnail_url'].append(item['snippet']['thumbnails']['high']['url'])
+                        (page['views'][page_count],
+                         page['likes'][page_count],
+                         page['comments_count'][page_count]) = _stats_to_ints(statistics)
+                        # Duration format: PT#M#S
+                        page['duration_seconds'][page_count] = self._parse_duration(video_info['contentDetails']['duration'])
+                        # commentCount is omitted from statistics when comments are disabled
+                        page['comments_enabled'][page_count] = 'commentCount' in statistics
+                        page['category_id'].append(video_category_id)
+                        page['category_name'].append(self._category_names.get(video_category_id, 'Unknown'))
+                        page['tags'].append(video_info['snippet'].get('tags', []))
+                        page['default_language'].append(video_info['snippet'].get('defaultLanguage', 'Unknown'))
+                        page['default_audio_language'].append(video_info['snippet'].get('defaultAudioLanguage', 'Unknown'))
+                        page_count += 1
+
+                        if page_count >= page_size:
                             break
 
+                row_count, page_count = page_count, 0
+                self._emit_page(page, row_count, subscriber_count, tables, sink)
+                remaining -= row_count
+
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
 
         except Exception as e:
             print(f"Error fetching videos: {e}")
+            # Keep the rows completed before the error
+            self._emit_page(page, page_count, subscriber_count, tables, sink)
 
-        return pd.DataFrame(video_details)
+        table = pa.concat_tables(tables or [VIDEO_SCHEMA.empty_table()])
+        if as_pandas:
+            # self_destruct releases each Arrow buffer once pandas owns the data
+            return table.to_pandas(self_destruct=True, split_blocks=True)
+        return table
 
-    def _parse_duration(self, duration_str: str) -> int:
+    def fetch_many(self, channel_ids, max_workers=MAX_WORKERS, as_pandas=False, **kwargs):
+        """
+        Fetch videos for several channels concurrently.
+        
+        Args:
+            channel_ids: Iterable of YouTube channel IDs
+            max_workers: Number of channels fetched at once (default: MAX_WORKERS)
+            as_pandas: Return a pandas DataFrame instead of an Arrow table (default: False)
+            **kwargs: Passed through to fetch_channel_videos (except sink)
+            
+        Returns:
+            pyarrow.Table: Video details for all channels, in channel_ids order,
+                or a pandas.DataFrame when as_pandas is True
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda channel_id: self.fetch_channel_videos(channel_id, **kwargs),
+                channel_ids
+            ))
+
+        # Chunks keep their own dictionaries; no data is copied here
+        table = pa.concat_tables(results or [VIDEO_SCHEMA.empty_table()])
+        if as_pandas:
+            return table.to_pandas(self_destruct=True, split_blocks=True)
+        return table
+
+    @staticmethod
+    def _new_page_buffers(size):
+        """
+        Create empty column buffers for one page of videos.
+        
+        Args:
+            size: Maximum number of rows in the page
+            
+        Returns:
+            dict: Column name to buffer; numeric columns are preallocated arrays
+        """
+        page = {field.name: [] for field in VIDEO_SCHEMA}
+        page['views'] = np.empty(size, dtype=np.int64)
+        page['likes'] = np.empty(size, dtype=np.int64)
+        page['comments_count'] = np.empty(size, dtype=np.int64)
+        page['duration_seconds'] = np.empty(size, dtype=np.int32)
+        page['comments_enabled'] = np.empty(size, dtype=bool)
+        del page['current_subscriber_count']
+        return page
+
+    @staticmethod
+    def _emit_page(page, row_count, subscriber_count, tables, sink):
+        """
+        Convert the first row_count rows of a page to an Arrow table and hand it off.
+        
+        Args:
+            page: Column buffers from _new_page_buffers
+            row_count: Number of complete rows in the buffers
+            subscriber_count: Channel subscriber count repeated on every row
+            tables: List collecting tables when no sink is given
+            sink: ParquetWriter to stream the table to, or None
+        """
+        if not row_count:
+            return
+        columns = {name: values[:row_count] for name, values in page.items()}
+        columns['current_subscriber_count'] = pa.repeat(pa.scalar(subscriber_count, pa.int64()), row_count)
+        table = pa.table(columns, schema=VIDEO_SCHEMA)
+        if sink is not None:
+            sink.write_table(table)
+        else:
+            tables.append(table)
+
+    def _cached_execute(self, request):
+        """
+        Execute an idempotent API request, reusing a cached response if one is fresh.
+        
+        Responses are kept in memory for the lifetime of the fetcher and on disk
+        under cache_dir for cache_ttl, keyed by the full request URI.
+        
+        Args:
+            request: googleapiclient HttpRequest to execute
+            
+        Returns:
+            dict: Parsed API response
+        """
+        key = hashlib.sha256(f"{request.method} {request.uri}".encode('utf-8')).hexdigest()
+        if key in self._response_cache:
+            return self._response_cache[key]
+
+        cache_path = os.path.join(self.cache_dir, f"{key}.json") if self.cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            if time.time() - os.path.getmtime(cache_path) < self.cache_ttl.total_seconds():
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    response = json.load(f)
+                self._response_cache[key] = response
+                return response
+
+        response = _execute(request)
+        self._response_cache[key] = response
+        if cache_path:
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(response, f)
+            os.replace(tmp_path, cache_path)
+        return response
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_duration(duration_str: str) -> int:
         """
         Convert YouTube duration string (PT#M#S) to seconds.
         
@@ -223,25 +528,40 @@ class YouTubeDataFetcher:
         Returns:
             int: Duration in seconds
         """
-        try:
-            return int(isodate.parse_duration(duration_str).total_seconds())
-        except:
+        match = _DURATION_RE.match(duration_str or '')
+        if not match:
             return 0
+        days, hours, minutes, seconds = (int(x) if x else 0 for x in match.groups())
+        return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
 
     def save_to_csv(self, dataframe, filename):
         """
-        Save DataFrame to CSV file.
+        Save video data to CSV file.
         
         Args:
-            dataframe: Pandas DataFrame to save
+            dataframe: Arrow table or pandas DataFrame to save
             filename: Output CSV filename path
         """
         try:
-            dataframe.to_csv(filename, index=False)
+            pacsv.write_csv(_csv_compatible(_as_table(dataframe)), filename)
             print(f"Data saved to {filename}")
         except Exception as e:
             print(f"Error saving to CSV: {e}")
 
+    def save_to_parquet(self, dataframe, filename):
+        """
+        Save video data to a zstd-compressed Parquet file.
+        
+        Args:
+            dataframe: Arrow table or pandas DataFrame to save
+            filename: Output Parquet filename path
+        """
+        try:
+            pq.write_table(_as_table(dataframe), filename, compression='zstd')
+            print(f"Data saved to {filename}")
+        except Exception as e:
+            print(f"Error saving to Parquet: {e}")
+
     def get_guide_categories(self, part='snippet', region_code='US'):
         """
         Retrieve available guide categories for a specific region.
@@ -255,9 +575,10 @@ class YouTubeDataFetcher:
         """
         request = self.youtube.videoCategories().list(
             part=part,
-            regionCode=region_code
+            regionCode=region_code,
+            fields='items(id,snippet/title)'
         )
-        response = request.execute()
+        response = self._cached_execute(request)
         
         categories = {}
         for category in response.get('items', []):
@@ -281,10 +602,11 @@ class YouTubeDataFetcher:
             type='channel',
             regionCode='US',
             videoCategoryId=category_id,
-            maxResults=max_results
+            maxResults=max_results,
+            fields=_FIELDS_CHANNEL_SEARCH
         )
         
-        response = request.execute()
+        response = _execute(request)
         
         channels = []
         for item in response.get('items', []):
@@ -297,7 +619,8 @@ class YouTubeDataFetcher:
         return channels
 
 
-    def get_top_channels_by_category(category_id: int, api_key: str, sample_size: int = 1000) -> List[dict]:
+    def get_top_channels_by_category(category_id: int, api_key: str, sample_size: int = 1000,
+                                     seed: Optional[int] = None) -> List[dict]:
         """
         Fetch top YouTube channels for a category and sample based on normal distribution.
         
@@ -305,12 +628,13 @@ class YouTubeDataFetcher:
             category_id: YouTube category ID
             api_key: YouTube Data API key
             sample_size: Number of channels to return (default: 1000)
+            seed: Seed for the sampling random generator (default: None)
             
         Returns:
             List[dict]: List of channel data dictionaries
         """
         # Initialize YouTube API client
-        youtube = build("youtube", "v3", developerKey=api_key)
+        youtube = _build_youtube(api_key)
         
         channels = []
         next_page_token = None
@@ -324,17 +648,19 @@ class YouTubeDataFetcher:
                     type="channel",
                     videoCategoryId=str(category_id),
                     order="viewCount",
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields=_FIELDS_CHANNEL_SEARCH
                 )
-                response = request.execute()
+                response = _execute(request)
                 
                 # Get detailed channel info including subscriber counts
                 channel_ids = [item['snippet']['channelId'] for item in response['items']]
                 channel_request = youtube.channels().list(
                     part="statistics,snippet",
-                    id=','.join(channel_ids)
+                    id=','.join(channel_ids),
+                    fields=_FIELDS_CHANNELS
                 )
-                channel_response = channel_request.execute()
+                channel_response = _execute(channel_request)
                 
                 for channel in channel_response['items']:
                     channels.append({
@@ -353,20 +679,29 @@ class YouTubeDataFetcher:
                 print(f"Error fetching channels: {e}")
                 break
         
-        # Sort by subscriber count
-        channels.sort(key=lambda x: x['subscriber_count'], reverse=True)
+        # Order by subscriber count, most subscribers first
+        subscriber_counts = np.fromiter(
+            (c['subscriber_count'] for c in channels), dtype=np.int64, count=len(channels)
+        )
+        order = np.argsort(-subscriber_counts, kind='stable')
         
         # Sample using normal distribution
         if len(channels) > sample_size:
             # Generate indices using normal distribution
             mu = 0  # Mean at the start (most subscribers)
             sigma = len(channels) / 4  # Standard deviation
-            indices = np.random.normal(mu, sigma, sample_size)
-            indices = np.clip(indices, 0, len(channels)-1).astype(int)
-            indices = np.unique(indices)  # Remove duplicates
+            upper = len(channels) - 1
+            rng = np.random.default_rng(seed)
+            # With mu on the lower bound, |N(mu, sigma)| is the normal truncated at 0;
+            # the few draws past the last rank are redrawn to truncate the upper tail
+            draws = np.abs(rng.normal(mu, sigma, sample_size))
+            out_of_range = draws > upper
+            while out_of_range.any():
+                draws[out_of_range] = np.abs(rng.normal(mu, sigma, np.count_nonzero(out_of_range)))
+                out_of_range = draws > upper
+            indices = np.unique(draws.astype(np.int64))  # Sorted, no duplicates
             
-            # Get channels at those indices
-            sampled_channels = [channels[i] for i in sorted(indices)]
-            return sampled_channels[:sample_size]
+            # Get channels at those ranks
+            return [channels[i] for i in order[indices[:sample_size]]]
         
-        return channels
\ No newline at end of file
+        return [channels[i] for i in order]
\ No newline at end of file